@@ -1,69 +1,621 @@
 # Imports
+import struct
+import sys
+import textwrap
+import threading
+import warnings
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
+from itertools import islice
 
 import requests
-from PIL import Image
+from PIL import ExifTags, Image
+from PIL.TiffImagePlugin import IFDRational
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3Error
+from urllib3.util.retry import Retry
+
+
+# Number of images downloaded in parallel
+_MAX_WORKERS = 16
+
+# HTTP session (shared connection pool, reused across downloads)
+_SESSION = requests.Session()
+# Images are already compressed, and byte ranges must apply to the raw file
+_SESSION.headers.update({
+    "User-Agent": "EXIF-Extract/1.0",
+    "Accept-Encoding": "identity"
+})
+_ADAPTER = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=_MAX_WORKERS,
+    max_retries=Retry(total=3, backoff_factor=0.3)
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+_TIMEOUT = (5, 30)
+
+# EXIF lives in the APP1 segment at the start of a JPEG, 128 KB covers it
+_HEADER_SIZE = 128 * 1024
+_HEADER_RANGE = f"bytes=0-{_HEADER_SIZE - 1}"
+
+# Pillow warns about EXIF data cut off by the range, which is then downloaded in full
+# (warnings.catch_warnings() changes global state, so it is guarded across threads)
+_WARNINGS_LOCK = threading.Lock()
+
+# Larger downloads are refused (only non-JPEG images are read in full)
+_MAX_IMAGE_SIZE = 100 * 1024 * 1024
+_CHUNK_SIZE = 64 * 1024
+
+# EXIF tags and their correspondences grouped by category, as (IFD, tag ID) pairs
+# since tag IDs are only unique within an IFD (nested tuples are cheaper to build
+# than dictionaries)
+_EXIF_TAGS = (
+    ("General Informations", (
+        ("ImageWidth", ("main", 256)),
+        ("ImageLength", ("main", 257)),
+        ("BitsPerSample", ("main", 258)),
+        ("Compression", ("main", 259)),
+        ("PhotometricInterpretation", ("main", 262)),
+        ("ImageDescription", ("main", 270)),
+        ("Make", ("main", 271)),
+        ("Model", ("main", 272)),
+        ("StripOffsets", ("main", 273)),
+        ("Orientation", ("main", 274)),
+        ("SamplesPerPixel", ("main", 277)),
+        ("RowsPerStrip", ("main", 278)),
+        ("StripByteCounts", ("main", 279)),
+        ("XResolution", ("main", 282)),
+        ("YResolution", ("main", 283)),
+        ("PlanarConfiguration", ("main", 284)),
+        ("ResolutionUnit", ("main", 296)),
+        ("TransferFunction", ("main", 301)),
+        ("Software", ("main", 305)),
+        ("DateTime", ("main", 306)),
+        ("Artist", ("main", 315)),
+        ("WhitePoint", ("main", 318)),
+        ("PrimaryChromaticities", ("main", 319)),
+        ("JPEGInterchangeFormat", ("main", 513)),
+        ("JPEGInterchangeFormatLength", ("main", 514)),
+        ("YCbCrCoefficients", ("main", 529)),
+        ("YCbCrSubSampling", ("main", 530)),
+        ("YCbCrPositioning", ("main", 531)),
+        ("ReferenceBlackWhite", ("main", 532)),
+        ("Copyright", ("main", 33432)),
+    )),
+    ("Camera Settings", (
+        ("ExposureTime", ("exif", 33434)),
+        ("FNumber", ("exif", 33437)),
+        ("ExposureProgram", ("exif", 34850)),
+        ("SpectralSensitivity", ("exif", 34852)),
+        ("ISOSpeedRatings", ("exif", 34855)),
+        ("OECF", ("exif", 34856)),
+        ("ExifVersion", ("exif", 36864)),
+        ("DateTimeOriginal", ("exif", 36867)),
+        ("DateTimeDigitized", ("exif", 36868)),
+        ("ComponentsConfiguration", ("exif", 37121)),
+        ("CompressedBitsPerPixel", ("exif", 37122)),
+        ("ShutterSpeedValue", ("exif", 37377)),
+        ("ApertureValue", ("exif", 37378)),
+        ("BrightnessValue", ("exif", 37379)),
+        ("ExposureBiasValue", ("exif", 37380)),
+        ("MaxApertureValue", ("exif", 37381)),
+        ("SubjectDistance", ("exif", 37382)),
+        ("MeteringMode", ("exif", 37383)),
+        ("LightSource", ("exif", 37384)),
+        ("Flash", ("exif", 37385)),
+        ("FocalLength", ("exif", 37386)),
+        ("SubjectArea", ("exif", 37396)),
+        ("MakerNote", ("exif", 37500)),
+        ("UserComment", ("exif", 37510)),
+        ("SubsecTime", ("exif", 37520)),
+        ("SubsecTimeOriginal", ("exif", 37521)),
+        ("SubsecTimeDigitized", ("exif", 37522)),
+        ("FlashpixVersion", ("exif", 40960)),
+        ("ColorSpace", ("exif", 40961)),
+        ("PixelXDimension", ("exif", 40962)),
+        ("PixelYDimension", ("exif", 40963)),
+        ("RelatedSoundFile", ("exif", 40964)),
+        ("FlashEnergy", ("exif", 41483)),
+        ("SpatialFrequencyResponse", ("exif", 41484)),
+        ("FocalPlaneXResolution", ("exif", 41486)),
+        ("FocalPlaneYResolution", ("exif", 41487)),
+        ("FocalPlaneResolutionUnit", ("exif", 41488)),
+        ("SubjectLocation", ("exif", 41492)),
+        ("ExposureIndex", ("exif", 41493)),
+        ("SensingMethod", ("exif", 41495)),
+        ("FileSource", ("exif", 41728)),
+        ("SceneType", ("exif", 41729)),
+        ("CFAPattern", ("exif", 41730)),
+        ("CustomRendered", ("exif", 41985)),
+        ("ExposureMode", ("exif", 41986)),
+        ("WhiteBalance", ("exif", 41987)),
+        ("DigitalZoomRatio", ("exif", 41988)),
+        ("FocalLengthIn35mmFilm", ("exif", 41989)),
+        ("SceneCaptureType", ("exif", 41990)),
+        ("GainControl", ("exif", 41991)),
+        ("Contrast", ("exif", 41992)),
+        ("Saturation", ("exif", 41993)),
+        ("Sharpness", ("exif", 41994)),
+        ("DeviceSettingDescription", ("exif", 41995)),
+        ("SubjectDistanceRange", ("exif", 41996)),
+        ("LensSpecification", ("exif", 42034)),
+        ("LensMake", ("exif", 42035)),
+        ("LensModel", ("exif", 42036)),
+        ("LensSerialNumber", ("exif", 42037)),
+    )),
+    ("GPS Information", (
+        ("GPSVersionID", ("gps", 0)),
+        ("GPSLatitudeRef", ("gps", 1)),
+        ("GPSLatitude", ("gps", 2)),
+        ("GPSLongitudeRef", ("gps", 3)),
+        ("GPSLongitude", ("gps", 4)),
+        ("GPSAltitudeRef", ("gps", 5)),
+        ("GPSAltitude", ("gps", 6)),
+        ("GPSTimeStamp", ("gps", 7)),
+        ("GPSSatellites", ("gps", 8)),
+        ("GPSStatus", ("gps", 9)),
+        ("GPSMeasureMode", ("gps", 10)),
+        ("GPSDOP", ("gps", 11)),
+        ("GPSSpeedRef", ("gps", 12)),
+        ("GPSSpeed", ("gps", 13)),
+        ("GPSTrackRef", ("gps", 14)),
+        ("GPSTrack", ("gps", 15)),
+        ("GPSImgDirectionRef", ("gps", 16)),
+        ("GPSImgDirection", ("gps", 17)),
+        ("GPSMapDatum", ("gps", 18)),
+        ("GPSDestLatitudeRef", ("gps", 19)),
+        ("GPSDestLatitude", ("gps", 20)),
+        ("GPSDestLongitudeRef", ("gps", 21)),
+        ("GPSDestLongitude", ("gps", 22)),
+        ("GPSDestBearingRef", ("gps", 23)),
+        ("GPSDestBearing", ("gps", 24)),
+        ("GPSDestDistanceRef", ("gps", 25)),
+        ("GPSDestDistance", ("gps", 26)),
+        ("GPSProcessingMethod", ("gps", 27)),
+        ("GPSAreaInformation", ("gps", 28)),
+        ("GPSDateStamp", ("gps", 29)),
+        ("GPSDifferential", ("gps", 30)),
+    )),
+    ("Miscellaneous Information", (
+        ("ImageUniqueID", ("exif", 42016)),
+        ("CameraOwnerName", ("exif", 42032)),
+        ("BodySerialNumber", ("exif", 42033)),
+        ("Gamma", ("exif", 42240)),
+    )),
+    ("Thumbnail Settings", (
+        ("ThumbnailImageWidth", ("ifd1", 256)),
+        ("ThumbnailImageLength", ("ifd1", 257)),
+        ("ThumbnailBitsPerSample", ("ifd1", 258)),
+        ("ThumbnailCompression", ("ifd1", 259)),
+        ("ThumbnailPhotometricInterpretation", ("ifd1", 262)),
+        ("ThumbnailImageDescription", ("ifd1", 270)),
+        ("ThumbnailMake", ("ifd1", 271)),
+        ("ThumbnailModel", ("ifd1", 272)),
+        ("ThumbnailStripOffsets", ("ifd1", 273)),
+        ("ThumbnailOrientation", ("ifd1", 274)),
+        ("ThumbnailSamplesPerPixel", ("ifd1", 277)),
+        ("ThumbnailRowsPerStrip", ("ifd1", 278)),
+        ("ThumbnailStripByteCounts", ("ifd1", 279)),
+        ("ThumbnailXResolution", ("ifd1", 282)),
+        ("ThumbnailYResolution", ("ifd1", 283)),
+        ("ThumbnailPlanarConfiguration", ("ifd1", 284)),
+        ("ThumbnailResolutionUnit", ("ifd1", 296)),
+        ("ThumbnailTransferFunction", ("ifd1", 301)),
+        ("ThumbnailSoftware", ("ifd1", 305)),
+        ("ThumbnailDateTime", ("ifd1", 306)),
+        ("ThumbnailArtist", ("ifd1", 315)),
+        ("ThumbnailWhitePoint", ("ifd1", 318)),
+        ("ThumbnailPrimaryChromaticities", ("ifd1", 319)),
+        ("ThumbnailJPEGInterchangeFormat", ("ifd1", 513)),
+        ("ThumbnailJPEGInterchangeFormatLength", ("ifd1", 514)),
+        ("ThumbnailYCbCrCoefficients", ("ifd1", 529)),
+        ("ThumbnailYCbCrSubSampling", ("ifd1", 530)),
+        ("ThumbnailYCbCrPositioning", ("ifd1", 531)),
+        ("ThumbnailReferenceBlackWhite", ("ifd1", 532)),
+        ("ThumbnailCopyright", ("ifd1", 33432)),
+    )),
+    ("Additional Information", (
+        ("InteroperabilityIndex", ("interop", 1)),
+        ("InteroperabilityVersion", ("interop", 2)),
+        ("RelatedImageFileFormat", ("interop", 4096)),
+        ("RelatedImageWidth", ("interop", 4097)),
+        ("RelatedImageLength", ("interop", 4098)),
+    ))
+)
+
+
+# Message shown when an image has no EXIF data
+_NO_EXIF_MSG = textwrap.dedent("""
+    No EXIF data found in the image.
+    Note that if the photo is from social media platforms,
+    they often remove EXIF data during the upload process
+    for privacy and data compression reasons.""")
+
+# Output line of a tag (%-formatting is cheaper than an f-string for plain values)
+_TAG_LINE = "  → %s: %s"
+
+# IFD names used in _EXIF_TAGS, None being the main image IFD (IFD0)
+_IFDS = {
+    "main": None,
+    "exif": ExifTags.IFD.Exif,
+    "gps": ExifTags.IFD.GPSInfo,
+    "interop": ExifTags.IFD.Interop,
+    "ifd1": ExifTags.IFD.IFD1
+}
 
 
 # Functions
-def extract_and_print_data(image, exif_tags):
+def get_exif_data(image):
+    """
+    Returns the EXIF data of an image, parsed only once per image.
+    Pillow caches the Exif object on the image and decodes tag values on access.
+
+    Args:
+        image (Image.Image or Image.Exif): Image object or EXIF data of a JPEG.
+
+    Returns:
+        dict: Dictionary mapping IFD names to mappings of EXIF tag IDs to their
+            values, empty if the image has no EXIF data.
+    """
+    exif = image if isinstance(image, Image.Exif) else image.getexif()
+    if not exif:
+        return {}
+
+    exif_data = {}
+    for ifd_name, ifd in _IFDS.items():
+        if ifd is None:
+            exif_data[ifd_name] = exif
+            continue
+        try:
+            exif_data[ifd_name] = exif.get_ifd(ifd)
+        except KeyError:
+            # Pillow raises instead of returning an empty IFD for a missing Interop
+            exif_data[ifd_name] = {}
+    return exif_data
+
+
+def build_tag_index(exif_tags):
+    """
+    Inverts the category/tag table into a lookup table keyed by (IFD, tag ID).
+
+    Args:
+        exif_tags (tuple): (category, ((name, (IFD, tag ID)), ...)) pairs.
+
+    Returns:
+        dict: Dictionary mapping each (IFD, tag ID) pair to a
+            (category, position in category, name) tuple.
+    """
+    return {
+        tag: (category, position, name)
+        for category, tags in exif_tags
+        for position, (name, tag) in enumerate(tags)
+    }
+
+
+def build_ifd_tagsets(exif_tags):
+    """
+    Groups the tag IDs of the category/tag table by IFD.
+
+    Args:
+        exif_tags (tuple): (category, ((name, (IFD, tag ID)), ...)) pairs.
+
+    Returns:
+        dict: Dictionary mapping each IFD name to a frozenset of its known tag IDs.
+    """
+    tagsets = defaultdict(set)
+    for _, tags in exif_tags:
+        for _, (ifd_name, tag) in tags:
+            tagsets[ifd_name].add(tag)
+    return {ifd_name: frozenset(tags) for ifd_name, tags in tagsets.items()}
+
+
+# Lookup tables derived from _EXIF_TAGS, built once at import
+_TAG_INDEX = build_tag_index(_EXIF_TAGS)
+_IFD_TAGSETS = build_ifd_tagsets(_EXIF_TAGS)
+
+
+def format_rational(value):
+    """
+    Formats an EXIF rational, or a tuple of them, from its integer parts.
+    Whole values are shown as integers (e.g. GPS degrees), others as decimals.
+
+    Args:
+        value (IFDRational or tuple): Rational value(s) to format.
+
+    Returns:
+        str: Formatted value.
+    """
+    if isinstance(value, tuple):
+        return f"({', '.join(format_rational(part) for part in value)})"
+
+    numerator, denominator = value.numerator, value.denominator
+    if not denominator:
+        return str(value)
+    if numerator % denominator == 0:
+        return str(numerator // denominator)
+    return str(numerator / denominator)
+
+
+def extract_and_print_data(image, exif_tags, tag_index=None, tagsets=None):
     """
     Extracts and prints formatted EXIF data from an image based on the provided tags.
     Improves readability by formatting binary values and skipping empty categories.
 
     Args:
-        image (Image.Image): Image object to extract EXIF data from.
-        exif_tags (dict): Dictionary mapping categories to their relevant EXIF tags.
+        image (Image.Image or Image.Exif): Image object or EXIF data of a JPEG.
+        exif_tags (tuple): (category, ((name, (IFD, tag ID)), ...)) pairs.
+        tag_index (dict, optional): Reverse index built by build_tag_index().
+            Built from exif_tags if not provided.
+        tagsets (dict, optional): Tag IDs by IFD built by build_ifd_tagsets().
+            Built from exif_tags if not provided.
     """
-    exif_data = image._getexif()
+    exif_data = get_exif_data(image)
 
     if not exif_data:
-        print("""\nNo EXIF data found in the image.
-Note that if the photo is from social media platforms,
-they often remove EXIF data during the upload process
-for privacy and data compression reasons.""")
+        print(_NO_EXIF_MSG)
         return
 
-    def print_decoded_exif(name, value):
-        """Prints EXIF data in a readable format."""
+    def format_decoded_exif(name, value):
+        """Formats EXIF data in a readable format."""
         if isinstance(value, bytes):
-            try:
-                value = value.decode()
-            except UnicodeDecodeError:
-                value = str(value)
+            # UserComment starts with an 8-byte character code (e.g. "ASCII")
+            if name == "UserComment":
+                value = value[8:]
+            value = value.decode("ascii", "replace").rstrip("\x00 ")
+        elif isinstance(value, IFDRational) or (
+            isinstance(value, tuple) and value
+            and all(isinstance(part, IFDRational) for part in value)
+        ):
+            value = format_rational(value)
+
+        return _TAG_LINE % (name, value)
+
+    if tag_index is None:
+        tag_index = build_tag_index(exif_tags)
+    if tagsets is None:
+        tagsets = build_ifd_tagsets(exif_tags)
+
+    # Sort the image's tags into their categories in a single pass,
+    # only decoding the values of known tags (found with a set intersection)
+    buckets = defaultdict(list)
+    for ifd_name, ifd in exif_data.items():
+        for tag in tagsets.get(ifd_name, frozenset()).intersection(ifd):
+            category, position, name = tag_index[(ifd_name, tag)]
+            buckets[category].append((position, name, ifd[tag]))
+
+    # Print categories if they're not empty, buffered into a single write
+    lines = []
+    for category, _ in exif_tags:
+        if category in buckets:
+            lines.append(f"\n{category.upper()}")
+            # Print names and values for each tag, in the category's order
+            for _, name, value in sorted(buckets[category], key=lambda entry: entry[0]):
+                lines.append(format_decoded_exif(name, value))
+
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def read_exactly(stream, size):
+    """
+    Reads a given number of bytes from a stream.
+
+    Args:
+        stream (file-like): Binary stream to read from.
+        size (int): Number of bytes to read.
+
+    Returns:
+        bytes: Data read from the stream.
+
+    Raises:
+        IOError: If the stream ends before enough bytes are read.
+    """
+    data = stream.read(size)
+    if len(data) != size:
+        raise IOError("Truncated JPEG header")
+    return data
+
 
-        print(f"  → {name}: {value}")
+def read_jpeg_exif(stream):
+    """
+    Reads the EXIF data from the APP1 segment of a JPEG without decoding the image.
+    Reading stops at the EXIF block, or at the start of the image data if there is none.
+
+    Args:
+        stream (file-like): JPEG stream positioned right after the SOI marker.
+
+    Returns:
+        Image.Exif: EXIF data of the image, empty if there is none.
+
+    Raises:
+        IOError: If the stream ends before the EXIF block.
+        SyntaxError: If the stream is not a valid JPEG.
+    """
+    exif = Image.Exif()
+    while True:
+        if read_exactly(stream, 1) != b"\xff":
+            raise SyntaxError("Invalid JPEG marker")
+        # Markers may be preceded by 0xFF fill bytes
+        marker = read_exactly(stream, 1)
+        while marker == b"\xff":
+            marker = read_exactly(stream, 1)
+
+        # Start of scan or end of image: no EXIF block before the image data
+        if marker in (b"\xda", b"\xd9"):
+            return exif
+
+        # The length includes its own two bytes, a smaller one would read the whole stream
+        (length,) = struct.unpack(">H", read_exactly(stream, 2))
+        if length < 2:
+            raise SyntaxError("Invalid JPEG segment length")
+        segment = read_exactly(stream, length - 2)
+        if marker == b"\xe1" and segment.startswith(b"Exif\x00\x00"):
+            exif.load(segment)
+            return exif
+
+
+def fetch(url, headers=None):
+    """
+    Sends a streamed GET request through the shared session.
+    The response is closed if its status is an error, releasing its connection.
+
+    Args:
+        url (str): URL to download.
+        headers (dict, optional): Additional request headers.
+
+    Returns:
+        requests.Response: Response opened with stream=True.
 
-    if exif_data is not None:
-        # Print categories if they're not empty
-        for category, tags in exif_tags.items():
-            if any(tag in exif_data for tag in tags.values()):
-                print(f"\n{category.upper()}")
-                # Print names and values for each tag
-                for name, tag in tags.items():
-                    if tag in exif_data:
-                        print_decoded_exif(name, exif_data[tag])
+    Raises:
+        requests.HTTPError: If the response status is an error.
+    """
+    response = _SESSION.get(url, headers=headers, timeout=_TIMEOUT, stream=True)
+    try:
+        response.raise_for_status()
+    except requests.HTTPError:
+        response.close()
+        raise
+    return response
+
+
+def check_response(response):
+    """
+    Checks the headers of a streamed HTTP response before its body is downloaded.
+    The response is closed if it is rejected.
+
+    Args:
+        response (requests.Response): Response opened with stream=True.
+
+    Returns:
+        str or None: Error message if the response is not a usable image, otherwise None.
+    """
+    content_type = response.headers.get("Content-Type", "")
+    content_length = response.headers.get("Content-Length", "")
+
+    error = None
+    # Media types are case-insensitive
+    if content_type and not content_type.lower().startswith("image/"):
+        error = f"Not an image: {content_type}"
+    elif content_length.isdigit() and int(content_length) > _MAX_IMAGE_SIZE:
+        error = f"Image too large: {content_length} bytes"
+
+    if error:
+        response.close()
+    return error
+
+
+def release_response(response):
+    """
+    Releases a streamed HTTP response once the data needed from it is read.
+    Short remaining bodies (e.g. partial content) are drained so the connection
+    goes back to the session's pool, others are closed without being downloaded.
+
+    Args:
+        response (requests.Response): Response opened with stream=True.
+    """
+    remaining = response.raw.length_remaining
+    if response.status_code == 206 or (remaining is not None and remaining <= _HEADER_SIZE):
+        response.raw.drain_conn()
+    response.close()
+
+
+def open_buffer(buffer):
+    """
+    Opens a downloaded image and parses its EXIF data.
+
+    Args:
+        buffer (BytesIO): Buffer holding the image data.
+
+    Returns:
+        Image.Image: PIL Image object.
+    """
+    image = Image.open(buffer)
+    # Make sure the EXIF block is complete
+    image.getexif()
+    return image
+
+
+def open_response(response):
+    """
+    Opens a streamed HTTP response, reading the raw stream directly.
+    Only the EXIF block of JPEG files is read, other formats are opened with Pillow.
+
+    Args:
+        response (requests.Response): Response opened with stream=True.
+
+    Returns:
+        Image.Exif, Image.Image or str: EXIF data of a JPEG, otherwise a PIL Image
+            object, or an error message if the image is too large.
+    """
+    stream = response.raw
+    stream.decode_content = True
+
+    # The rest of the body is not needed once the EXIF block is read
+    try:
+        prefix = stream.read(2)
+        if prefix == b"\xff\xd8":
+            return read_jpeg_exif(stream)
+
+        # Copy the body straight into the buffer, without concatenating bytes copies,
+        # and stop once it is too large (the server may not send Content-Length)
+        buffer = BytesIO()
+        buffer.write(prefix)
+        while chunk := stream.read(_CHUNK_SIZE):
+            buffer.write(chunk)
+            if buffer.tell() > _MAX_IMAGE_SIZE:
+                return f"Image too large: over {_MAX_IMAGE_SIZE} bytes"
+        buffer.seek(0)
+    finally:
+        release_response(response)
+
+    if response.status_code == 206:
+        with _WARNINGS_LOCK, warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            return open_buffer(buffer)
+    return open_buffer(buffer)
 
 
 def get_image(url):
     """
-    Attempts to download an image from a URL and open it as a PIL Image object.
+    Attempts to download an image from a URL and read its EXIF data.
+    Responses that are not images, or too large, are rejected before their body is read.
+    Only the leading bytes holding the EXIF header are requested first, the
+    full image is downloaded if the server ignores the range or if the EXIF
+    block doesn't fit in it.
     Handles various exceptions related to network issues and image file errors.
 
     Args:
         url (str): URL of the image to be downloaded.
 
     Returns:
-        Image.Image or str: PIL Image object if successful, otherwise an error message.
+        Image.Exif, Image.Image or str: EXIF data of a JPEG or PIL Image object
+            if successful, otherwise an error message.
     """
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        return Image.open(BytesIO(response.content))
+        response = fetch(url, headers={"Range": _HEADER_RANGE})
+        error = check_response(response)
+        if error:
+            return error
 
-    except requests.RequestException as e:
+        # Partial content: the EXIF block may not fit in the range
+        # (malformed data raises SyntaxError, and is not downloaded again)
+        if response.status_code == 206:
+            try:
+                return open_response(response)
+            except (IOError, Urllib3Error):
+                response = fetch(url)
+                error = check_response(response)
+                if error:
+                    return error
+
+        return open_response(response)
+
+    # Reading response.raw raises urllib3 errors, not requests ones
+    except (requests.RequestException, Urllib3Error) as e:
         return f"Error downloading the image: {e}"
-    except IOError as e:
+    except (IOError, SyntaxError) as e:
         return f"Error opening the image: {e}"
     except Exception as e:
         return f"Unexpected error: {e}"
@@ -71,191 +623,38 @@ def get_image(url):
 
 def main():
     """
-    Main function to handle user input and display EXIF data of an image.
+    Main function to handle user input and display EXIF data of images.
+    URLs are read from the command line or from user input (separated by spaces)
+    and downloaded in parallel.
     """
-    url = input("Image URL (e.g. www.example.com/image.png): ")
-    image = get_image(url)
-
-    # If the image variable contains an Image object
-    if isinstance(image, Image.Image):
-        # Dictionary of EXIF tags and their correspondences
-        exif_tags = {
-            "General Informations": {
-                "ImageWidth": 256,
-                "ImageLength": 257,
-                "BitsPerSample": 258,
-                "Compression": 259,
-                "PhotometricInterpretation": 262,
-                "ImageDescription": 270,
-                "Make": 271,
-                "Model": 272,
-                "StripOffsets": 273,
-                "Orientation": 274,
-                "SamplesPerPixel": 277,
-                "RowsPerStrip": 278,
-                "StripByteCounts": 279,
-                "XResolution": 282,
-                "YResolution": 283,
-                "PlanarConfiguration": 284,
-                "ResolutionUnit": 296,
-                "TransferFunction": 301,
-                "Software": 305,
-                "DateTime": 306,
-                "Artist": 315,
-                "WhitePoint": 318,
-                "PrimaryChromaticities": 319,
-                "JPEGInterchangeFormat": 513,
-                "JPEGInterchangeFormatLength": 514,
-                "YCbCrCoefficients": 529,
-                "YCbCrSubSampling": 530,
-                "YCbCrPositioning": 531,
-                "ReferenceBlackWhite": 532,
-                "Copyright": 33432
-            },
-            "Camera Settings": {
-                "ExposureTime": 33434,
-                "FNumber": 33437,
-                "ExposureProgram": 34850,
-                "SpectralSensitivity": 34852,
-                "ISOSpeedRatings": 34855,
-                "OECF": 34856,
-                "ExifVersion": 36864,
-                "DateTimeOriginal": 36867,
-                "DateTimeDigitized": 36868,
-                "ComponentsConfiguration": 37121,
-                "CompressedBitsPerPixel": 37122,
-                "ShutterSpeedValue": 37377,
-                "ApertureValue": 37378,
-                "BrightnessValue": 37379,
-                "ExposureBiasValue": 37380,
-                "MaxApertureValue": 37381,
-                "SubjectDistance": 37382,
-                "MeteringMode": 37383,
-                "LightSource": 37384,
-                "Flash": 37385,
-                "FocalLength": 37386,
-                "SubjectArea": 37396,
-                "MakerNote": 37500,
-                "UserComment": 37510,
-                "SubsecTime": 37520,
-                "SubsecTimeOriginal": 37521,
-                "SubsecTimeDigitized": 37522,
-                "FlashpixVersion": 40960,
-                "ColorSpace": 40961,
-                "PixelXDimension": 40962,
-                "PixelYDimension": 40963,
-                "RelatedSoundFile": 40964,
-                "FlashEnergy": 41483,
-                "SpatialFrequencyResponse": 41484,
-                "FocalPlaneXResolution": 41486,
-                "FocalPlaneYResolution": 41487,
-                "FocalPlaneResolutionUnit": 41488,
-                "SubjectLocation": 41492,
-                "ExposureIndex": 41493,
-                "SensingMethod": 41495,
-                "FileSource": 41728,
-                "SceneType": 41729,
-                "CFAPattern": 41730,
-                "CustomRendered": 41985,
-                "ExposureMode": 41986,
-                "WhiteBalance": 41987,
-                "DigitalZoomRatio": 41988,
-                "FocalLengthIn35mmFilm": 41989,
-                "SceneCaptureType": 41990,
-                "GainControl": 41991,
-                "Contrast": 41992,
-                "Saturation": 41993,
-                "Sharpness": 41994,
-                "DeviceSettingDescription": 41995,
-                "SubjectDistanceRange": 41996,
-                "LensSpecification": 42034,
-                "LensMake": 42035,
-                "LensModel": 42036,
-                "LensSerialNumber": 42037
-            },
-            "GPS Information": {
-                "GPSVersionID": 0,
-                "GPSLatitudeRef": 1,
-                "GPSLatitude": 2,
-                "GPSLongitudeRef": 3,
-                "GPSLongitude": 4,
-                "GPSAltitudeRef": 5,
-                "GPSAltitude": 6,
-                "GPSTimeStamp": 7,
-                "GPSSatellites": 8,
-                "GPSStatus": 9,
-                "GPSMeasureMode": 10,
-                "GPSDOP": 11,
-                "GPSSpeedRef": 12,
-                "GPSSpeed": 13,
-                "GPSTrackRef": 14,
-                "GPSTrack": 15,
-                "GPSImgDirectionRef": 16,
-                "GPSImgDirection": 17,
-                "GPSMapDatum": 18,
-                "GPSDestLatitudeRef": 19,
-                "GPSDestLatitude": 20,
-                "GPSDestLongitudeRef": 21,
-                "GPSDestLongitude": 22,
-                "GPSDestBearingRef": 23,
-                "GPSDestBearing": 24,
-                "GPSDestDistanceRef": 25,
-                "GPSDestDistance": 26,
-                "GPSProcessingMethod": 27,
-                "GPSAreaInformation": 28,
-                "GPSDateStamp": 29,
-                "GPSDifferential": 30
-            },
-            "Miscellaneous Information": {
-                "ImageUniqueID": 42016,
-                "CameraOwnerName": 42032,
-                "BodySerialNumber": 42033,
-                "Gamma": 42240
-            },
-            "Thumbnail Settings": {
-                "ThumbnailImageWidth": 256,
-                "ThumbnailImageLength": 257,
-                "ThumbnailBitsPerSample": 258,
-                "ThumbnailCompression": 259,
-                "ThumbnailPhotometricInterpretation": 262,
-                "ThumbnailImageDescription": 270,
-                "ThumbnailMake": 271,
-                "ThumbnailModel": 272,
-                "ThumbnailStripOffsets": 273,
-                "ThumbnailOrientation": 274,
-                "ThumbnailSamplesPerPixel": 277,
-                "ThumbnailRowsPerStrip": 278,
-                "ThumbnailStripByteCounts": 279,
-                "ThumbnailXResolution": 282,
-                "ThumbnailYResolution": 283,
-                "ThumbnailPlanarConfiguration": 284,
-                "ThumbnailResolutionUnit": 296,
-                "ThumbnailTransferFunction": 301,
-                "ThumbnailSoftware": 305,
-                "ThumbnailDateTime": 306,
-                "ThumbnailArtist": 315,
-                "ThumbnailWhitePoint": 318,
-                "ThumbnailPrimaryChromaticities": 319,
-                "ThumbnailJPEGInterchangeFormat": 513,
-                "ThumbnailJPEGInterchangeFormatLength": 514,
-                "ThumbnailYCbCrCoefficients": 529,
-                "ThumbnailYCbCrSubSampling": 530,
-                "ThumbnailYCbCrPositioning": 531,
-                "ThumbnailReferenceBlackWhite": 532,
-                "ThumbnailCopyright": 33432
-            },
-            "Additional Information": {
-                "InteroperabilityIndex": 1,
-                "InteroperabilityVersion": 2,
-                "RelatedImageFileFormat": 4096,
-                "RelatedImageWidth": 4097,
-                "RelatedImageLength": 4098
-            }
-        }
-
-        extract_and_print_data(image, exif_tags)
-    else:
-        print(image)
+    urls = sys.argv[1:] or input("Image URL(s) (e.g. www.example.com/image.png): ").split()
+    if not urls:
+        print("No image URL given.")
+        return
+
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+        # Keep at most _MAX_WORKERS downloads in flight, so that finished images
+        # waiting to be printed don't pile up in memory behind a slow one
+        remaining = iter(urls)
+        pending = deque(
+            (url, executor.submit(get_image, url))
+            for url in islice(remaining, _MAX_WORKERS)
+        )
+        while pending:
+            url, future = pending.popleft()
+            image = future.result()
+            for next_url in islice(remaining, 1):
+                pending.append((next_url, executor.submit(get_image, next_url)))
+
+            # Tell images apart when several URLs are given
+            if len(urls) > 1:
+                print(f"\n[{url}]")
+
+            # If the image variable contains EXIF data or an Image object
+            if isinstance(image, (Image.Exif, Image.Image)):
+                extract_and_print_data(image, _EXIF_TAGS, _TAG_INDEX, _IFD_TAGSETS)
+            else:
+                print(image)
 
 
 # Main